@@ -5,18 +5,20 @@ Usage: for programmatic use import `send_mail_simplified.EmailSender`.
 from __future__ import annotations
 
 import argparse
-from typing import List
+import json
+from typing import Dict, List
 from send_mail_simplified import EmailSender
 
 
-def _parse_args() -> argparse.Namespace:
-    """Build and parse the command-line arguments for the CLI.
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI.
 
-    Returns an argparse.Namespace with the parsed CLI options. This helper
-    centralizes the flag definitions used by the module-level CLI `main()`.
+    Called once at import time; the resulting parser is reused by
+    `_parse_args()` so repeated parses (and tests) skip the relatively
+    expensive argparse construction.
 
     Flags include SMTP connection options, credentials, from/to/subject/body,
-    HTML flag, and attachments.
+    HTML flag, attachments, and batch sending.
     """
     parser = argparse.ArgumentParser(description="Send an email via custom SMTP server")
     parser.add_argument(
@@ -26,7 +28,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--username", help="SMTP username (optional)")
     parser.add_argument("--password", help="SMTP password (optional)")
     parser.add_argument("--from", dest="sender", help="From email address")
-    parser.add_argument("--to", required=True, help="Recipient(s) (comma separated)")
+    parser.add_argument("--to", help="Recipient(s) (comma separated)")
     parser.add_argument("--subject", default="", help="Email subject")
     parser.add_argument("--body", default="", help="Email body")
     parser.add_argument("--html", action="store_true", help="Send body as HTML")
@@ -37,7 +39,48 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--attach", action="append", help="Path to attachment (can be repeated)"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch-file",
+        help="Path to a JSON or NDJSON file of message dicts to send "
+        "over a single SMTP connection (ignores --to/--subject/--body)",
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command-line arguments using the module-level parser.
+
+    Returns:
+        argparse.Namespace: the parsed CLI options.
+    """
+    return _PARSER.parse_args()
+
+
+def _load_batch(path: str) -> List[Dict]:
+    """Load message dicts from a JSON or NDJSON batch file.
+
+    The file may contain either a single JSON array of message dicts or one
+    JSON object per line (NDJSON). Each dict holds EmailSender.send keyword
+    arguments (recipients, subject, body, html, attachments).
+
+    Args:
+        path: Path to the batch file.
+
+    Returns:
+        List[Dict]: The parsed message dicts.
+    """
+    with open(path, "r", encoding="utf-8") as fp:
+        text = fp.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    if isinstance(data, list):
+        return data
+    return [data]
 
 
 def _to_list(s: str) -> List[str]:
@@ -51,7 +94,9 @@ def _to_list(s: str) -> List[str]:
     Returns:
         List[str]: The non-empty, stripped components of the input string.
     """
-    return [part.strip() for part in s.split(",") if part.strip()]
+    # Split on commas only: addresses may carry display names with spaces
+    # ("Jane Doe <jane@example.com>"), so whitespace is not a separator.
+    return list(filter(None, map(str.strip, s.split(","))))
 
 
 def main() -> None:
@@ -71,6 +116,8 @@ def main() -> None:
     - None
     """
     args = _parse_args()
+    if not args.batch_file and not args.to:
+        raise SystemExit("either --to or --batch-file is required")
     # Create sender with connection settings
     sender = EmailSender(
         smtp_server=args.smtp_server,
@@ -81,12 +128,18 @@ def main() -> None:
         use_tls=not args.no_tls,
         sender=args.sender,
     )
+    if args.batch_file:
+        # Send every message in the batch over one SMTP connection
+        with sender:
+            sender.send_many(_load_batch(args.batch_file))
+        return
     # Send the message
     sender.send(
         recipients=_to_list(args.to),
         subject=args.subject,
         body=args.body,
         html=args.html,
+        attachments=args.attach,
     )
 
 
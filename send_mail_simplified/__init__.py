@@ -3,8 +3,36 @@
 Public API:
 - EmailSender: class for sending emails via configurable SMTP server
 - send_email: legacy function API for sending emails (prefer EmailSender)
+- SMTPConnectionPool: thread-safe pool of SMTP connections for concurrent senders
+- AsyncEmailSender: asyncio sender built on aiosmtplib (requires the "async" extra)
+- BulkAbortError: raised when a bulk send fails for some or all messages
+
+The submodules are imported lazily (PEP 562) so `import send_mail_simplified`
+does not pay for smtplib/ssl/email until something actually sends.
 """
 
-from .smtp_sender import EmailSender, send_email
+__all__ = [
+    "AsyncEmailSender",
+    "BulkAbortError",
+    "EmailSender",
+    "SMTPConnectionPool",
+    "send_email",
+]
+
+_EXPORTS = {
+    "AsyncEmailSender": "async_sender",
+    "BulkAbortError": "smtp_sender",
+    "EmailSender": "smtp_sender",
+    "SMTPConnectionPool": "pool",
+    "send_email": "smtp_sender",
+}
+
+
+def __getattr__(name: str):
+    """Resolve a public name by importing its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
 
-__all__ = ["EmailSender", "send_email"]
+    return getattr(import_module(f".{module_name}", __name__), name)
@@ -0,0 +1,73 @@
+"""App-level DNS cache for SMTP hostnames.
+
+`smtplib` resolves the server hostname with `socket.getaddrinfo` on every
+connection, and a slow or misconfigured resolver can dominate the cost of
+short-lived sends. This module keeps a small TTL-bound cache of lookups so
+repeated connections to the same server skip the resolver: successful
+results are kept for 5 minutes, failures for 1 minute so a flapping
+resolver is not hammered either.
+"""
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from typing import List, Tuple
+
+# TTLs in seconds for cached lookups. Positive results are safe to keep for
+# minutes (SMTP servers rarely move); negative results are kept briefly so a
+# transient resolver failure does not poison the cache for long.
+_POSITIVE_TTL = 300.0
+_NEGATIVE_TTL = 60.0
+_MAX_ENTRIES = 128
+
+# (host, port) -> (expires_at, getaddrinfo results or the OSError raised)
+_cache: dict = {}
+_lock = threading.Lock()
+
+
+def resolve(host: str, port: int) -> List[Tuple]:
+    """Resolve a host/port pair, caching results with a TTL.
+
+    Args:
+        host: hostname (or IP literal) to resolve.
+        port: TCP port, forwarded to getaddrinfo.
+
+    Returns:
+        The `socket.getaddrinfo` result list for a stream connection.
+
+    Raises:
+        OSError: if resolution fails (failures are cached for a short TTL
+            and re-raised without hitting the resolver again).
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            result = entry[1]
+            if isinstance(result, OSError):
+                raise result
+            return result
+
+    try:
+        result = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError as exc:
+        _store(key, now + _NEGATIVE_TTL, exc)
+        raise
+    _store(key, now + _POSITIVE_TTL, result)
+    return result
+
+
+def clear() -> None:
+    """Drop every cached lookup (e.g. after a known resolver change)."""
+    with _lock:
+        _cache.clear()
+
+
+def _store(key: Tuple[str, int], expires_at: float, result) -> None:
+    """Insert a cache entry, resetting the cache if it has grown too large."""
+    with _lock:
+        if len(_cache) >= _MAX_ENTRIES and key not in _cache:
+            _cache.clear()
+        _cache[key] = (expires_at, result)
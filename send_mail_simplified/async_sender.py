@@ -0,0 +1,231 @@
+"""Asynchronous SMTP email sender built on aiosmtplib.
+
+Provides `AsyncEmailSender`, an asyncio counterpart to `EmailSender` so one
+event loop can hold many in-flight SMTP conversations: the network waits
+(DNS, TCP, TLS handshake, server replies) overlap instead of serializing.
+
+Requires the optional `aiosmtplib` dependency:
+
+    pip install send_mail_simplified[async]
+"""
+from __future__ import annotations
+
+import asyncio
+from email.message import EmailMessage
+from typing import Dict, Iterable, List, Optional, Union
+
+from .smtp_sender import _build_message
+
+
+def _aiosmtplib():
+    """Import aiosmtplib lazily so the rest of the package stays stdlib-only.
+
+    Returns:
+        The imported aiosmtplib module.
+
+    Raises:
+        ImportError: if aiosmtplib is not installed, with an install hint.
+    """
+    try:
+        import aiosmtplib
+    except ImportError as exc:
+        raise ImportError(
+            "aiosmtplib is required for AsyncEmailSender; install it with: "
+            "pip install send_mail_simplified[async]"
+        ) from exc
+    return aiosmtplib
+
+
+class AsyncEmailSender:
+    """Asynchronous email sender that connects to a specified SMTP server.
+
+    Mirrors EmailSender's configuration and API but with coroutine methods,
+    so many sends can be awaited concurrently on one event loop. Used as an
+    async context manager the connection persists across `send()` calls.
+
+    Example:
+        async with AsyncEmailSender("smtp.example.com", username="u", password="p") as s:
+            await s.send(recipients="you@example.com", subject="Hi", body="Test")
+    """
+
+    def __init__(
+        self,
+        smtp_server: str,
+        smtp_port: int = 587,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        use_ssl: bool = False,
+        sender: str | None = None,
+        timeout: Optional[float] = 10.0,
+    ) -> None:
+        """Initialize AsyncEmailSender with SMTP connection settings.
+
+        Args:
+            smtp_server: hostname or IP of SMTP server.
+            smtp_port: port to connect to (defaults: 587 for STARTTLS, 465 for SSL).
+            username: username for authentication.
+            password: password for authentication.
+            use_tls: whether to use STARTTLS (only when use_ssl is False).
+            use_ssl: whether to use SMTPS (connect with SSL). If True, `use_tls` is ignored.
+            sender: envelope From address. If None and username provided, username is used.
+            timeout: socket timeout in seconds.
+        """
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = use_ssl
+        self.sender = sender or username or "noreply@example.com"
+        self.timeout = timeout
+        self._server = None
+        self._persistent = False
+
+    async def __aenter__(self) -> "AsyncEmailSender":
+        """Enter an `async with` block, keeping the connection open across sends."""
+        self._persistent = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Leave the `async with` block and close the SMTP connection."""
+        self._persistent = False
+        await self.close()
+
+    async def _connect(self):
+        """Return a live aiosmtplib.SMTP connection, opening one if necessary.
+
+        Returns:
+            aiosmtplib.SMTP: a connected (and, if configured, authenticated) server.
+        """
+        aiosmtplib = _aiosmtplib()
+        if self._server is not None:
+            try:
+                await self._server.noop()
+                return self._server
+            except (aiosmtplib.SMTPException, OSError):
+                await self.close()
+
+        server = aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            use_tls=self.use_ssl,
+            start_tls=self.use_tls if not self.use_ssl else False,
+            timeout=self.timeout,
+        )
+        await server.connect()
+        if self.username:
+            await server.login(self.username, self.password or "")
+        self._server = server
+        return server
+
+    async def close(self) -> None:
+        """Close the held SMTP connection, if any."""
+        server = self._server
+        self._server = None
+        if server is None:
+            return
+        aiosmtplib = _aiosmtplib()
+        try:
+            await server.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            server.close()
+
+    async def send(
+        self,
+        recipients: Union[str, List[str]] | None = None,
+        subject: str = "",
+        body: str = "",
+        html: bool = False,
+        attachments: Optional[List[str]] = None,
+    ) -> None:
+        """Send an email using the configured SMTP settings.
+
+        Args:
+            recipients: address(es) to send to.
+            subject: message subject.
+            body: message body (plain text or HTML depending on `html`).
+            html: whether body should be sent as HTML.
+            attachments: optional list of file paths to attach.
+
+        Raises:
+            ValueError: if recipients is None or empty.
+            aiosmtplib.SMTPException: if sending fails.
+        """
+        msg = _build_message(
+            sender=self.sender,
+            recipients=recipients,
+            subject=subject,
+            body=body,
+            html=html,
+            attachments=attachments,
+        )
+        try:
+            server = await self._connect()
+            await server.send_message(msg)
+        finally:
+            if not self._persistent:
+                await self.close()
+
+    async def send_many(
+        self,
+        messages: Iterable[Union[Dict, EmailMessage]],
+    ) -> None:
+        """Send several messages over a single SMTP connection.
+
+        Args:
+            messages: an iterable of ready-made EmailMessage objects or of
+                dicts with `send` keyword arguments (recipients, subject,
+                body, html, attachments).
+
+        Raises:
+            ValueError: if a message dict has no usable recipients.
+            aiosmtplib.SMTPException: if sending fails.
+        """
+        try:
+            server = await self._connect()
+            for message in messages:
+                if isinstance(message, EmailMessage):
+                    msg = message
+                else:
+                    msg = _build_message(sender=self.sender, **message)
+                await server.send_message(msg)
+        finally:
+            if not self._persistent:
+                await self.close()
+
+    async def send_all(
+        self,
+        messages: Iterable[Dict],
+        concurrency: int = 32,
+    ) -> None:
+        """Fan out messages over up to `concurrency` parallel connections.
+
+        Each in-flight message uses its own connection, so the total wall
+        time approaches the slowest single send instead of the sum of all
+        of them. Use `send_many` instead when one connection is enough.
+
+        Args:
+            messages: an iterable of dicts with `send` keyword arguments.
+            concurrency: maximum number of simultaneous SMTP connections.
+
+        Raises:
+            aiosmtplib.SMTPException: if any send fails.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send_one(message: Dict) -> None:
+            async with semaphore:
+                sender = AsyncEmailSender(
+                    smtp_server=self.smtp_server,
+                    smtp_port=self.smtp_port,
+                    username=self.username,
+                    password=self.password,
+                    use_tls=self.use_tls,
+                    use_ssl=self.use_ssl,
+                    sender=self.sender,
+                    timeout=self.timeout,
+                )
+                await sender.send(**message)
+
+        await asyncio.gather(*(_send_one(message) for message in messages))
@@ -0,0 +1,189 @@
+"""Thread-safe SMTP connection pool.
+
+Lets concurrent senders share a bounded set of live SMTP connections instead
+of serializing on a single EmailSender instance or opening one connection per
+thread. Connections are recycled after a configurable number of messages so
+provider per-connection limits are respected.
+"""
+from __future__ import annotations
+
+import queue
+import smtplib
+import threading
+from typing import Dict, Optional, Tuple
+
+from .smtp_sender import _open_connection
+
+
+class SMTPConnectionPool:
+    """Pool of authenticated SMTP connections for one server/account.
+
+    Threads `acquire()` a live connection, send through it, and `release()`
+    it back; the pool keeps at most `max_connections` connections alive and
+    quits each one after `max_messages_per_connection` messages.
+
+    Example:
+        pool = SMTPConnectionPool("smtp.example.com", username="u", password="p")
+        server = pool.acquire()
+        try:
+            server.send_message(msg)
+        finally:
+            pool.release(server)
+    """
+
+    def __init__(
+        self,
+        smtp_server: str,
+        smtp_port: int = 587,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        use_ssl: bool = False,
+        timeout: Optional[float] = 10.0,
+        max_connections: int = 4,
+        max_messages_per_connection: int = 100,
+    ) -> None:
+        """Initialize the pool with SMTP connection settings and limits.
+
+        Args:
+            smtp_server: hostname or IP of SMTP server.
+            smtp_port: port to connect to.
+            username: username for authentication.
+            password: password for authentication.
+            use_tls: whether to use STARTTLS (only when use_ssl is False).
+            use_ssl: whether to use SMTPS (connect with SSL).
+            timeout: socket timeout in seconds.
+            max_connections: maximum number of simultaneously open connections.
+            max_messages_per_connection: messages sent through one connection
+                before it is closed and replaced (provider rate-limit friendly).
+        """
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        # Idle connections as (server, messages_sent) tuples; LIFO so the
+        # most recently used (least likely to have timed out) comes back first.
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, int]]" = queue.LifoQueue()
+        # Message counts of checked-out connections, keyed by server object.
+        self._live: Dict[smtplib.SMTP, int] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @property
+    def key(self) -> Tuple[str, int, bool, Optional[str]]:
+        """Identity of the server/account this pool connects to."""
+        return (self.smtp_server, self.smtp_port, self.use_ssl, self.username)
+
+    def acquire(self, timeout: Optional[float] = None) -> smtplib.SMTP:
+        """Check out a live SMTP connection, opening one if under the limit.
+
+        Blocks when `max_connections` are already checked out until one is
+        released.
+
+        Args:
+            timeout: seconds to wait for a free connection (None = forever).
+
+        Returns:
+            smtplib.SMTP: a connected, authenticated server object.
+
+        Raises:
+            queue.Empty: if no connection became free within `timeout`.
+            smtplib.SMTPException: if opening a new connection fails.
+        """
+        try:
+            server, count = self._idle.get_nowait()
+        except queue.Empty:
+            create = False
+            with self._lock:
+                if self._created < self.max_connections:
+                    self._created += 1
+                    create = True
+            if create:
+                try:
+                    server, count = self._connect(), 0
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                server, count = self._idle.get(timeout=timeout)
+        with self._lock:
+            self._live[server] = count
+        return server
+
+    def release(self, server: smtplib.SMTP) -> None:
+        """Return a connection to the pool after sending one message.
+
+        The per-connection message count is incremented; once it reaches
+        `max_messages_per_connection` the connection is quit instead of
+        being returned, and a later `acquire()` opens a fresh one.
+
+        Args:
+            server: the connection previously obtained from `acquire()`.
+        """
+        with self._lock:
+            count = self._live.pop(server, 0) + 1
+        if count >= self.max_messages_per_connection:
+            self._quit(server)
+            with self._lock:
+                self._created -= 1
+        else:
+            self._idle.put((server, count))
+
+    def discard(self, server: smtplib.SMTP) -> None:
+        """Drop a broken connection without returning it to the pool.
+
+        Args:
+            server: the connection previously obtained from `acquire()`.
+        """
+        with self._lock:
+            self._live.pop(server, None)
+            self._created -= 1
+        self._quit(server)
+
+    def close(self) -> None:
+        """Quit every idle connection and reset the pool."""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(server)
+            with self._lock:
+                self._created -= 1
+
+    def __enter__(self) -> "SMTPConnectionPool":
+        """Enter a `with` block; the pool is closed on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Leave the `with` block and close all idle connections."""
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new connection using the pool's settings."""
+        return _open_connection(
+            smtp_server=self.smtp_server,
+            smtp_port=self.smtp_port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            use_ssl=self.use_ssl,
+            timeout=self.timeout,
+        )
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        """Politely close a connection, falling back to a hard close."""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            try:
+                server.close()
+            except (smtplib.SMTPException, OSError):
+                pass
@@ -6,9 +6,96 @@ so it can be packaged for Anaconda without extra dependencies.
 """
 from __future__ import annotations
 
-import smtplib
-from email.message import EmailMessage
-from typing import List, Optional, Union
+import functools
+import mmap
+import os
+import sys
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+from . import _dns
+
+# smtplib (which drags in ssl and the email package) and mimetypes are
+# imported inside the functions that need them: they cost tens of ms on a
+# cold start, which matters for `--help` and other paths that never send.
+if TYPE_CHECKING:
+    import smtplib
+    from email.message import EmailMessage
+
+    from .pool import SMTPConnectionPool
+
+# Attachments at least this large are memory-mapped instead of read into a
+# bytes object, so the OS pages them in on demand rather than holding an
+# extra full copy in memory.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Attachments at least this large are read with O_DIRECT on Linux, skipping
+# the kernel page cache entirely — the data is about to be base64-encoded and
+# sent once, so caching it only costs an extra kernel-to-cache copy.
+_DIRECT_IO_THRESHOLD = 16 * 1024 * 1024
+_DIRECT_IO_CHUNK = 1024 * 1024
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context():
+    """Build the SSL context shared by every connection, on first use.
+
+    ssl.create_default_context() loads the system CA bundle from disk — the
+    slow part of TLS setup — so one context is created once and reused by
+    all SMTPS and STARTTLS connections. Sharing the context also lets TLS
+    session resumption shortcut repeat handshakes to the same host.
+
+    Returns:
+        ssl.SSLContext: the shared client context with default verification.
+    """
+    import ssl
+
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_type(suffix: str):
+    """Guess the content type for a file suffix, with caching.
+
+    Attachment batches tend to repeat a handful of extensions, so the lookup
+    is cached on the lowercased suffix rather than re-querying the mimetypes
+    tables per file. The system mime.types tables are parsed once, on the
+    first attachment.
+
+    Args:
+        suffix: lowercased file extension including the dot (may be empty).
+
+    Returns:
+        Tuple of (type, encoding) as returned by mimetypes.guess_type.
+    """
+    import mimetypes
+
+    if not mimetypes.inited:
+        mimetypes.init()
+    return mimetypes.guess_type("name" + suffix)
+
+
+# A bulk send is abandoned once at least this many messages have been
+# attempted and a third or more of them failed — continuing a broadly
+# failing batch only wastes the connection and risks provider throttling.
+_BULK_ABORT_MIN_BATCH = 30
+
+
+class BulkAbortError(Exception):
+    """Raised when a bulk send fails for some or all of its messages.
+
+    Attributes:
+        failures: list of (message_index, exception) pairs for every message
+            that could not be sent before the batch finished or was aborted.
+    """
+
+    def __init__(self, message: str, failures: List) -> None:
+        """Record the error message and the per-message failures.
+
+        Args:
+            message: human-readable summary of what went wrong.
+            failures: (message_index, exception) pairs in send order.
+        """
+        super().__init__(message)
+        self.failures = failures
 
 
 def _ensure_list(recipients: Union[str, List[str]]) -> List[str]:
@@ -29,7 +116,247 @@ def _ensure_list(recipients: Union[str, List[str]]) -> List[str]:
     """
     if isinstance(recipients, (list, tuple)):
         return list(recipients)
-    return [r.strip() for r in str(recipients).split(",") if r.strip()]
+    # Split on commas only: addresses may carry display names with spaces
+    # ("Jane Doe <jane@example.com>"), so whitespace is not a separator.
+    return list(filter(None, map(str.strip, str(recipients).split(","))))
+
+
+def _validate_attachments(paths: List[str]) -> None:
+    """Check that every attachment path exists before any MIME work is done.
+
+    Paths are grouped by directory and each directory is listed once with
+    os.scandir, so validating N files from one folder costs a single
+    directory read instead of N stat calls — and a bad path fails the send
+    before any body or attachment encoding has been wasted.
+
+    Args:
+        paths: attachment file paths to check.
+
+    Raises:
+        FileNotFoundError: if any path does not exist or is not a file,
+            listing every missing path at once.
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or ".", []).append(path)
+
+    missing = []
+    for directory, dir_paths in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            missing.extend(dir_paths)
+            continue
+        for path in dir_paths:
+            if os.path.basename(path) not in names:
+                missing.append(path)
+
+    if missing:
+        raise FileNotFoundError(
+            "attachment(s) not found: " + ", ".join(sorted(missing))
+        )
+
+
+def _read_direct(path: str, size: int) -> memoryview:
+    """Read a file with O_DIRECT into a page-aligned anonymous map.
+
+    O_DIRECT requires block-aligned buffers and read sizes; an anonymous
+    mmap is page-aligned by construction and reads are issued in aligned
+    1 MiB chunks, with the final short read at EOF permitted by the kernel.
+
+    Args:
+        path: file to read.
+        size: file size in bytes (already stat'ed by the caller).
+
+    Returns:
+        memoryview: a view of exactly the file's bytes.
+
+    Raises:
+        OSError: if the file cannot be opened with O_DIRECT (e.g. the
+            filesystem does not support it) or a read fails.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    try:
+        # Round the scratch buffer up to a whole number of pages so every
+        # chunk-sized slice handed to readv stays aligned.
+        buf = mmap.mmap(-1, size + (-size) % mmap.PAGESIZE)
+        view = memoryview(buf)
+        offset = 0
+        while offset < size:
+            chunk = view[offset : offset + _DIRECT_IO_CHUNK]
+            read = os.readv(fd, [chunk])
+            if read == 0:
+                raise OSError(f"unexpected EOF reading {path!r} at byte {offset}")
+            offset += read
+        return view[:size]
+    finally:
+        os.close(fd)
+
+
+def _read_attachment(path: str):
+    """Read attachment data as a bytes-like object for add_attachment.
+
+    Small files are read normally; files over _MMAP_THRESHOLD are
+    memory-mapped so the encoder pages them in on demand; files over
+    _DIRECT_IO_THRESHOLD on Linux bypass the page cache with O_DIRECT,
+    falling back to the mapped path if the filesystem refuses it.
+
+    Args:
+        path: file to read.
+
+    Returns:
+        bytes or memoryview: the file contents. Callers should release()
+        memoryview results once the data has been consumed.
+
+    Raises:
+        OSError: if the file cannot be read.
+    """
+    size = os.path.getsize(path)
+    if (
+        size >= _DIRECT_IO_THRESHOLD
+        and sys.platform == "linux"
+        and hasattr(os, "O_DIRECT")
+    ):
+        try:
+            return _read_direct(path, size)
+        except OSError:
+            pass
+    with open(path, "rb") as fp:
+        if size >= _MMAP_THRESHOLD:
+            return memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+        return fp.read()
+
+
+def _build_message(
+    sender: str,
+    recipients: Union[str, List[str]] | None = None,
+    subject: str = "",
+    body: str = "",
+    html: bool = False,
+    attachments: Optional[List[str]] = None,
+) -> EmailMessage:
+    """Build an EmailMessage from the given fields.
+
+    Shared by the synchronous and asynchronous senders.
+
+    Args:
+        sender: envelope From address.
+        recipients: address(es) the message is addressed to.
+        subject: message subject.
+        body: message body (plain text or HTML depending on `html`).
+        html: whether body should be sent as HTML.
+        attachments: optional list of file paths to attach.
+
+    Returns:
+        EmailMessage: the fully assembled message.
+
+    Raises:
+        ValueError: if recipients is None or empty.
+        OSError: if an attachment path cannot be read.
+    """
+    import email.policy
+    from email.message import EmailMessage
+
+    if recipients is None:
+        raise ValueError("recipients must be provided")
+
+    to_addrs = _ensure_list(recipients)
+    if not to_addrs:
+        raise ValueError("no recipients parsed from recipients argument")
+
+    if attachments:
+        _validate_attachments(attachments)
+
+    # Build against the wire-format policy from the start, so send_message
+    # does not have to re-fold headers for transport at serialization time.
+    msg = EmailMessage(policy=email.policy.SMTP)
+    msg["From"] = sender
+    msg["To"] = ", ".join(to_addrs)
+    msg["Subject"] = subject
+
+    if html:
+        msg.add_alternative(body, subtype="html")
+    else:
+        msg.set_content(body)
+
+    for path in attachments or []:
+        ctype, encoding = _guess_type(os.path.splitext(path)[1].lower())
+        if ctype is None or encoding is not None:
+            ctype = "application/octet-stream"
+        maintype, subtype = ctype.split("/", 1)
+        data = _read_attachment(path)
+        try:
+            msg.add_attachment(
+                data,
+                maintype=maintype,
+                subtype=subtype,
+                filename=os.path.basename(path),
+            )
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+    return msg
+
+
+def _open_connection(
+    smtp_server: str,
+    smtp_port: int = 587,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    use_tls: bool = True,
+    use_ssl: bool = False,
+    timeout: Optional[float] = 10.0,
+) -> smtplib.SMTP:
+    """Open, secure and authenticate a new SMTP connection.
+
+    Shared by EmailSender and SMTPConnectionPool so both go through the
+    same EHLO/STARTTLS/LOGIN sequence.
+
+    Args:
+        smtp_server: hostname or IP of SMTP server.
+        smtp_port: port to connect to.
+        username: username for authentication.
+        password: password for authentication.
+        use_tls: whether to use STARTTLS (only when use_ssl is False).
+        use_ssl: whether to use SMTPS (connect with SSL).
+        timeout: socket timeout in seconds.
+
+    Returns:
+        smtplib.SMTP: a connected, secured and (if configured) logged-in server.
+    """
+    import smtplib
+
+    if use_ssl:
+        # SMTPS handshakes (and validates the certificate) inside the
+        # constructor, so it must see the real hostname; no IP-pinning or
+        # cache involvement here — smtplib resolves via getaddrinfo itself.
+        server = smtplib.SMTP_SSL(
+            smtp_server, smtp_port, timeout=timeout, context=_ssl_context()
+        )
+    else:
+        # Connect straight to the cached IP so create_connection skips its
+        # own getaddrinfo; resolution errors fall back to the hostname and
+        # are surfaced by smtplib's lookup instead.
+        host = smtp_server
+        try:
+            host = _dns.resolve(smtp_server, smtp_port)[0][4][0]
+        except OSError:
+            pass
+        server = smtplib.SMTP(host, smtp_port, timeout=timeout)
+        # starttls() uses _host as the TLS server_hostname, so SNI and
+        # certificate validation must see the original name, not the IP.
+        server._host = smtp_server
+        if use_tls:
+            # No explicit EHLO needed: starttls() issues one itself when the
+            # session hasn't been greeted yet, and resets the EHLO state so
+            # the next command (login/send) re-greets over the encrypted
+            # channel.
+            server.starttls(context=_ssl_context())
+
+    if username:
+        server.login(username, password or "")
+    return server
 
 
 class EmailSender:
@@ -38,6 +365,17 @@ class EmailSender:
     This class provides email sending functionality with optional STARTTLS/SSL,
     authentication, and file attachments. Uses Python's standard library only.
 
+    The sender can be used as a context manager to reuse a single SMTP
+    connection across multiple `send()` calls, paying the TCP/TLS/AUTH
+    handshake once instead of once per message:
+
+        with EmailSender("smtp.example.com", username="u", password="p") as s:
+            s.send(recipients="a@example.com", subject="Hi", body="Test")
+            s.send(recipients="b@example.com", subject="Hi", body="Test")
+
+    Outside a `with` block each `send()` still opens and closes its own
+    connection, so single-shot callers behave exactly as before.
+
     Example:
         sender = EmailSender("smtp.example.com", username="user", password="pass")
         sender.send(recipients="you@example.com", subject="Hi", body="Test")
@@ -74,6 +412,127 @@ class EmailSender:
         self.use_ssl = use_ssl
         self.sender = sender or username or "noreply@example.com"
         self.timeout = timeout
+        self._server: Optional[smtplib.SMTP] = None
+        self._persistent = False
+        self._pool: Optional["SMTPConnectionPool"] = None
+
+    @classmethod
+    def from_pool(cls, pool: "SMTPConnectionPool") -> "EmailSender":
+        """Create an EmailSender that sends through a shared connection pool.
+
+        The sender inherits the pool's connection settings; every `send()`
+        checks a connection out of the pool and returns it afterwards, so
+        multiple threads can share one pool without serializing.
+
+        Args:
+            pool: the SMTPConnectionPool to draw connections from.
+
+        Returns:
+            EmailSender: a sender bound to the pool.
+        """
+        sender = cls(
+            smtp_server=pool.smtp_server,
+            smtp_port=pool.smtp_port,
+            username=pool.username,
+            password=pool.password,
+            use_tls=pool.use_tls,
+            use_ssl=pool.use_ssl,
+            timeout=pool.timeout,
+        )
+        sender._pool = pool
+        return sender
+
+    def __enter__(self) -> "EmailSender":
+        """Enter a `with` block, keeping the SMTP connection open across sends."""
+        self._persistent = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Leave the `with` block and close the SMTP connection."""
+        self._persistent = False
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Return a live SMTP connection, opening one if necessary.
+
+        If a connection from a previous `send()` is still held, its health is
+        checked with NOOP; a dead connection is discarded and replaced, so
+        callers always get a usable server object.
+
+        Returns:
+            smtplib.SMTP: a connected (and, if configured, authenticated) server.
+        """
+        import smtplib
+
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPException, OSError):
+                self.close()
+
+        self._server = _open_connection(
+            smtp_server=self.smtp_server,
+            smtp_port=self.smtp_port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            use_ssl=self.use_ssl,
+            timeout=self.timeout,
+        )
+        return self._server
+
+    def close(self) -> None:
+        """Close the held SMTP connection, if any.
+
+        Safe to call multiple times; QUIT failures fall back to a hard close.
+        """
+        import smtplib
+
+        server = self._server
+        self._server = None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            try:
+                server.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+    def _build_message(
+        self,
+        recipients: Union[str, List[str]] | None = None,
+        subject: str = "",
+        body: str = "",
+        html: bool = False,
+        attachments: Optional[List[str]] = None,
+    ) -> EmailMessage:
+        """Build an EmailMessage from the given fields.
+
+        Args:
+            recipients: address(es) the message is addressed to.
+            subject: message subject.
+            body: message body (plain text or HTML depending on `html`).
+            html: whether body should be sent as HTML.
+            attachments: optional list of file paths to attach.
+
+        Returns:
+            EmailMessage: the fully assembled message.
+
+        Raises:
+            ValueError: if recipients is None or empty.
+            OSError: if an attachment path cannot be read.
+        """
+        return _build_message(
+            sender=self.sender,
+            recipients=recipients,
+            subject=subject,
+            body=body,
+            html=html,
+            attachments=attachments,
+        )
 
     def send(
         self,
@@ -81,6 +540,9 @@ class EmailSender:
         subject: str = "",
         body: str = "",
         html: bool = False,
+        attachments: Optional[List[str]] = None,
+        pool: Optional["SMTPConnectionPool"] = None,
+        message: Optional["EmailMessage"] = None,
     ) -> None:
         """Send an email using the configured SMTP settings.
 
@@ -89,11 +551,114 @@ class EmailSender:
             subject: message subject.
             body: message body (plain text or HTML depending on `html`).
             html: whether body should be sent as HTML.
+            attachments: optional list of file paths to attach.
+            pool: optional SMTPConnectionPool to send through instead of the
+                sender's own connection (defaults to the pool given to
+                `from_pool`, if any).
+            message: optional pre-built EmailMessage sent as-is; when given,
+                the construction is skipped and the recipients/subject/body/
+                html/attachments arguments are ignored. Useful when the same
+                deterministic message is sent repeatedly.
+
+        Raises:
+            ValueError: if recipients is None or empty and no message given.
+            smtplib.SMTPException: if sending fails.
+        """
+        import smtplib
+
+        if message is not None:
+            msg = message
+        else:
+            msg = self._build_message(
+                recipients=recipients,
+                subject=subject,
+                body=body,
+                html=html,
+                attachments=attachments,
+            )
+        pool = pool if pool is not None else self._pool
+        if pool is not None:
+            self._send_via_pool(pool, msg)
+            return
+        # Establish (or reuse) the connection and send
+        try:
+            server = self._connect()
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped the (reused) connection; reconnect and
+                # retry once before giving up.
+                self.close()
+                self._connect().send_message(msg)
+        finally:
+            if not self._persistent:
+                self.close()
+
+    @staticmethod
+    def _send_via_pool(pool: "SMTPConnectionPool", msg: EmailMessage) -> None:
+        """Send a message through a pooled connection.
+
+        A dead connection (server dropped it while idle) is discarded and the
+        send retried once on a fresh one; the connection is always returned
+        to or removed from the pool.
+
+        Args:
+            pool: the connection pool to draw from.
+            msg: the message to send.
+
+        Raises:
+            smtplib.SMTPException: if sending fails.
+        """
+        import smtplib
+
+        server = pool.acquire()
+        try:
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Clear the reference before reacquiring: if acquire() fails
+                # here, the outer handler must not discard the dead server a
+                # second time and corrupt the pool's connection accounting.
+                pool.discard(server)
+                server = None
+                server = pool.acquire()
+                server.send_message(msg)
+        except Exception:
+            if server is not None:
+                pool.discard(server)
+            raise
+        pool.release(server)
+
+    def send_broadcast(
+        self,
+        recipients: Union[str, List[str]] | None = None,
+        subject: str = "",
+        body: str = "",
+        html: bool = False,
+        attachments: Optional[List[str]] = None,
+    ) -> None:
+        """Send the same message to many recipients, one envelope each.
+
+        The message (including any attachments) is built, encoded and
+        serialized exactly once; each recipient is then addressed purely at
+        the envelope level via `sendmail`, BCC-style, so neither the base64
+        encoding nor the RFC 5322 serialization is repeated per recipient.
+        The To: header carries the sender's own address, as is conventional
+        for undisclosed-recipient bulk mail.
+
+        Args:
+            recipients: address(es) to send to, one send per address.
+            subject: message subject.
+            body: message body (plain text or HTML depending on `html`).
+            html: whether body should be sent as HTML.
+            attachments: optional list of file paths to attach.
 
         Raises:
             ValueError: if recipients is None or empty.
             smtplib.SMTPException: if sending fails.
         """
+        import email.policy
+
         if recipients is None:
             raise ValueError("recipients must be provided")
 
@@ -101,40 +666,95 @@ class EmailSender:
         if not to_addrs:
             raise ValueError("no recipients parsed from recipients argument")
 
-        msg = EmailMessage()
-        msg["From"] = self.sender
-        msg["To"] = ", ".join(to_addrs)
-        msg["Subject"] = subject
+        msg = self._build_message(
+            recipients=self.sender,
+            subject=subject,
+            body=body,
+            html=html,
+            attachments=attachments,
+        )
+        # One serialization pass for the whole broadcast; sendmail reuses the
+        # raw bytes with a fresh envelope per recipient. SMTPUTF8 is only
+        # negotiated when an envelope address actually needs it.
+        raw = msg.as_bytes(policy=email.policy.SMTP)
+        utf8 = any(ord(ch) > 127 for ch in self.sender + "".join(to_addrs))
+        options = ["SMTPUTF8"] if utf8 else []
+        try:
+            server = self._connect()
+            for addr in to_addrs:
+                if options:
+                    server.sendmail(self.sender, [addr], raw, mail_options=options)
+                else:
+                    server.sendmail(self.sender, [addr], raw)
+        finally:
+            if not self._persistent:
+                self.close()
 
-        if html:
-            msg.add_alternative(body, subtype="html")
-        else:
-            msg.set_content(body)
-        # Establish connection and send
-        if self.use_ssl:
-            smtp_class = smtplib.SMTP_SSL
-        else:
-            smtp_class = smtplib.SMTP
+    def send_many(
+        self,
+        messages: Iterable[Union[Dict, EmailMessage]],
+    ) -> None:
+        """Send several messages over a single SMTP connection.
 
-        server = smtp_class(self.smtp_server, self.smtp_port, timeout=self.timeout)
-        try:
-            if not self.use_ssl and self.use_tls:
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
+        Connecting once and looping over the messages turns the per-message
+        TCP/TLS/AUTH handshake into a one-time cost, which is where the bulk
+        of the wall-clock time goes when sending many small emails.
 
-            if self.username:
-                server.login(self.username, self.password or "")
+        Per-message refusals are tolerated and collected, but once at least
+        30 messages have been attempted and a third or more of them failed,
+        the batch is abandoned — iterating a broadly failing batch only
+        wastes the connection and invites provider throttling. A failed
+        authentication aborts immediately, since retrying it never helps.
 
-            server.send_message(msg)
-        finally:
-            try:
-                server.quit()
-            except smtplib.SMTPResponseException:
+        Args:
+            messages: an iterable of ready-made EmailMessage objects or of
+                dicts with `_build_message` keyword arguments (recipients,
+                subject, body, html, attachments).
+
+        Raises:
+            ValueError: if a message dict has no usable recipients.
+            BulkAbortError: if any message failed; raised early when the
+                failure threshold is hit, otherwise after the whole batch.
+            smtplib.SMTPException: if authentication or the connection fails.
+        """
+        import smtplib
+        from email.message import EmailMessage
+
+        failures: List = []
+        total_seen = 0
+        try:
+            server = self._connect()
+            for index, message in enumerate(messages):
+                if isinstance(message, EmailMessage):
+                    msg = message
+                else:
+                    msg = self._build_message(**message)
+                total_seen += 1
                 try:
-                    server.close()
-                except smtplib.SMTPResponseException:
-                    pass
+                    server.send_message(msg)
+                except smtplib.SMTPAuthenticationError:
+                    raise
+                except (
+                    smtplib.SMTPRecipientsRefused,
+                    smtplib.SMTPResponseException,
+                ) as exc:
+                    failures.append((index, exc))
+                    if (
+                        total_seen >= _BULK_ABORT_MIN_BATCH
+                        and len(failures) * 3 >= total_seen
+                    ):
+                        raise BulkAbortError(
+                            f"aborting bulk send: {len(failures)} of "
+                            f"{total_seen} messages failed",
+                            failures,
+                        ) from exc
+        finally:
+            if not self._persistent:
+                self.close()
+        if failures:
+            raise BulkAbortError(
+                f"{len(failures)} of {total_seen} messages failed", failures
+            )
 
 
 # Legacy function API for backward compatibility
@@ -151,6 +771,7 @@ def send_email(
     use_tls: bool = True,
     use_ssl: bool = False,
     timeout: Optional[float] = 10.0,
+    message: Optional["EmailMessage"] = None,
 ) -> None:
     """Send an email (legacy function API, prefer using EmailSender class).
 
@@ -170,11 +791,13 @@ def send_email(
         use_tls: whether to use STARTTLS
         use_ssl: whether to use SMTPS. If True, `use_tls` is ignored.
         timeout: socket timeout in seconds.
+        message: optional pre-built EmailMessage sent as-is instead of
+            constructing one from recipients/subject/body/html.
 
     Raises:
         smtplib.SMTPException: if sending fails.
     """
-    sender = EmailSender(
+    with EmailSender(
         smtp_server=smtp_server,
         smtp_port=smtp_port,
         username=username,
@@ -183,10 +806,11 @@ def send_email(
         use_ssl=use_ssl,
         sender=sender,
         timeout=timeout,
-    )
-    sender.send(
-        recipients=recipients,
-        subject=subject,
-        body=body,
-        html=html,
-    )
+    ) as email_sender:
+        email_sender.send(
+            recipients=recipients,
+            subject=subject,
+            body=body,
+            html=html,
+            message=message,
+        )
@@ -27,4 +27,5 @@ setup(
     packages=find_packages(exclude=("tests",)),
     python_requires=">=3.8",
     include_package_data=True,
+    extras_require={"async": ["aiosmtplib>=2.0"]},
 )
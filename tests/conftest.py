@@ -0,0 +1,139 @@
+"""Shared test fixtures and fakes for the send_mail_simplified suite.
+
+Builds SMTP connection stand-ins with a make_fake() factory and installs
+them over smtplib a single time per session, so individual tests pay no
+patch setup/teardown cost. Each connection attempt produces a fresh fake;
+tests fetch the one their code under test created via current_fake().
+"""
+import smtplib
+import socket
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from send_mail_simplified import _dns
+
+# EHLO/QUIT/close (and NOOP for connection-reuse health checks) need no
+# behavior; sharing one argument-swallowing lambda avoids a closure and
+# frame allocation per fake while still mirroring smtplib's API.
+_NOOP = lambda *args, **kwargs: None  # noqa: E731
+
+
+class _FakeConnection(SimpleNamespace):
+    """SimpleNamespace with identity equality and hashing restored.
+
+    SimpleNamespace compares by attribute dict and therefore loses
+    hashability, but SMTPConnectionPool keys dicts by the server object —
+    as real smtplib.SMTP instances allow — so the fake must behave the
+    same way.
+    """
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+
+def make_fake(host, port, timeout=None, context=None):
+    """Build a fake SMTP connection as a SimpleNamespace.
+
+    Stateful methods are small closures writing into one shared `_state`
+    dict, so no class body, __init__ dispatch, or per-instance bound
+    methods beyond the three closures are involved. Tests assert on
+    ``fake._state`` keys:
+
+    - "tls": True once starttls() was invoked
+    - "login": (username, password) tuple once login() was invoked
+    - "sent": True once a message passed header validation
+    - "msg": the last message object delivered to send_message()
+    - "envelopes": (from_addr, to_addrs, raw) triples given to sendmail()
+
+    Args:
+        host: SMTP server host passed to constructor.
+        port: SMTP server port passed to constructor.
+        timeout: Optional socket timeout value.
+        context: Optional SSLContext, mirroring smtplib.SMTP_SSL.
+    """
+    state = {
+        "tls": False,
+        "login": False,
+        "sent": False,
+        "msg": None,
+        "envelopes": [],
+    }
+    ns = _FakeConnection(host=host, port=port, timeout=timeout, _state=state)
+    ns.ehlo = ns.noop = ns.quit = ns.close = _NOOP
+
+    def starttls(context=None):
+        state["tls"] = True
+
+    def login(username, password):
+        state["login"] = (username, password)
+
+    def send_message(msg):
+        # Validate From/To are present with a single pass over the raw
+        # header list — each msg[...] lookup is a case-insensitive linear
+        # scan, so doing two of them per sent message adds up in
+        # bulk-sending tests.
+        has_from = has_to = False
+        for name, _ in msg._headers:
+            lowered = name.lower()
+            has_from = has_from or lowered == "from"
+            has_to = has_to or lowered == "to"
+        assert has_from and has_to
+        state["sent"] = True
+        state["msg"] = msg
+
+    def sendmail(from_addr, to_addrs, raw, mail_options=(), rcpt_options=()):
+        state["envelopes"].append((from_addr, list(to_addrs), raw))
+
+    ns.starttls = starttls
+    ns.login = login
+    ns.send_message = send_message
+    ns.sendmail = sendmail
+    return ns
+
+
+# The most recent fake created on this thread; thread-local so tests that
+# exercise pooled/concurrent senders each see their own connection.
+_current = threading.local()
+
+
+def current_fake():
+    """Return the fake connection created by the most recent SMTP call."""
+    return _current.fake
+
+
+def _fake_factory(*args, **kwargs):
+    """Stand-in for smtplib.SMTP and SMTP_SSL: build and remember a fake."""
+    _current.fake = make_fake(*args, **kwargs)
+    return _current.fake
+
+
+def _fake_resolve(host, port):
+    """Stand-in for _dns.resolve: echo the hostname, never hit a resolver.
+
+    Returns a single getaddrinfo-style entry whose address is the hostname
+    itself, so the IP-pinning path in _open_connection is exercised without
+    changing what the fake SMTP constructor receives.
+    """
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (host, port))]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_smtplib():
+    """Swap smtplib's connection classes and DNS resolution for fakes.
+
+    Session-scoped and autouse: one set of setattrs for the whole run
+    instead of a patch start/stop per test. Every test path in this suite
+    goes through smtplib, so stubbing unconditionally is always correct.
+    SMTP and SMTP_SSL share one factory; the fakes behave identically and
+    tests distinguish the transports by what was (not) invoked on them.
+    _dns.resolve is stubbed alongside so the STARTTLS path's IP-pinning
+    lookup never reaches the host's resolver and the suite stays hermetic.
+    """
+    orig = (smtplib.SMTP, smtplib.SMTP_SSL, _dns.resolve)
+    smtplib.SMTP = _fake_factory
+    smtplib.SMTP_SSL = _fake_factory
+    _dns.resolve = _fake_resolve
+    yield
+    smtplib.SMTP, smtplib.SMTP_SSL, _dns.resolve = orig
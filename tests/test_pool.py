@@ -0,0 +1,138 @@
+"""Tests for SMTPConnectionPool.
+
+Covers connection reuse, recycling at the per-connection message limit,
+discarding broken connections, blocking at the connection cap, and the
+`_created` accounting under concurrent acquire/release. The session-scoped
+smtplib stub hands out a fresh fake per connection attempt, so object
+identity distinguishes reused connections from newly opened ones.
+"""
+import queue
+import smtplib
+import threading
+
+import pytest
+
+from send_mail_simplified.pool import SMTPConnectionPool
+from send_mail_simplified.smtp_sender import EmailSender, _build_message
+
+
+def _pool(**overrides):
+    """Build a pool against the stubbed smtplib with small test limits."""
+    settings = dict(
+        smtp_server="smtp.example",
+        smtp_port=587,
+        username="user",
+        password="pass",
+        max_connections=2,
+        max_messages_per_connection=100,
+    )
+    settings.update(overrides)
+    return SMTPConnectionPool(**settings)
+
+
+def test_pool_reuses_released_connection():
+    """A released connection comes back from the next acquire (LIFO)."""
+    with _pool() as pool:
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        assert pool._created == 1
+        pool.release(first)
+
+
+def test_pool_recycles_at_max_messages():
+    """A connection is quit and replaced once its message quota is spent."""
+    with _pool(max_messages_per_connection=2) as pool:
+        server = pool.acquire()
+        pool.release(server)
+        assert pool.acquire() is server
+        pool.release(server)
+        # Second release hit the quota: the connection was quit, the slot
+        # freed, and the next acquire must open a fresh one.
+        assert pool._created == 0
+        assert pool.acquire() is not server
+        assert pool._created == 1
+
+
+def test_pool_discard_drops_connection():
+    """Discarding frees the slot so a fresh connection can be opened."""
+    with _pool(max_connections=1) as pool:
+        broken = pool.acquire()
+        pool.discard(broken)
+        assert pool._created == 0
+        replacement = pool.acquire()
+        assert replacement is not broken
+        pool.release(replacement)
+
+
+def test_pool_blocks_at_max_connections():
+    """With every slot checked out, acquire waits for a release."""
+    with _pool(max_connections=1) as pool:
+        held = pool.acquire()
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.01)
+        pool.release(held)
+        assert pool.acquire(timeout=0.01) is held
+        pool.release(held)
+
+
+def test_send_via_pool_discards_once_when_reacquire_fails():
+    """A failed reconnect must not discard the dead connection twice.
+
+    When the held connection dies and the replacement acquire() also
+    fails, only the dead connection's slot is freed — a second discard
+    would drive _created negative and let the pool exceed its cap.
+    """
+    msg = _build_message(
+        sender="me@example.com",
+        recipients=["you@example.com"],
+        subject="hi",
+        body="hello",
+    )
+    with _pool(max_connections=1) as pool:
+        dead = pool.acquire()
+        pool.release(dead)
+
+        def raise_disconnected(message):
+            raise smtplib.SMTPServerDisconnected("connection dropped")
+
+        def fail_connect():
+            raise smtplib.SMTPConnectError(421, "service not available")
+
+        dead.send_message = raise_disconnected
+        pool._connect = fail_connect
+
+        with pytest.raises(smtplib.SMTPConnectError):
+            EmailSender._send_via_pool(pool, msg)
+        assert pool._created == 0
+
+        # With connectivity restored the freed slot supports exactly one
+        # new connection again.
+        del pool._connect
+        replacement = pool.acquire()
+        assert replacement is not dead
+        assert pool._created == 1
+        pool.release(replacement)
+
+
+def test_pool_threaded_acquire_respects_cap():
+    """Concurrent senders never exceed max_connections open connections."""
+    with _pool(max_connections=2) as pool:
+        seen = set()
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                server = pool.acquire(timeout=5)
+                with lock:
+                    seen.add(server)
+                pool.release(server)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(seen) <= 2
+        assert pool._created <= 2
@@ -0,0 +1,119 @@
+"""Tests for EmailSender.send_many bulk-send behavior.
+
+Covers the partial-failure collection, the abort-early threshold, and the
+authentication short-circuit. The session-scoped smtplib stub supplies the
+fake connection; each test wraps its send_message to refuse chosen indices.
+"""
+import smtplib
+
+import pytest
+
+from conftest import current_fake
+from send_mail_simplified.smtp_sender import (
+    _BULK_ABORT_MIN_BATCH,
+    BulkAbortError,
+    EmailSender,
+)
+
+
+def _sender():
+    """Build a persistent sender and open its (fake) connection eagerly.
+
+    Connections are normally opened lazily on first send; connecting here
+    lets each test grab the fake via current_fake() and instrument its
+    send_message before the batch starts.
+    """
+    sender = EmailSender(
+        smtp_server="smtp.example",
+        smtp_port=587,
+        sender="me@example.com",
+    )
+    sender._connect()
+    return sender
+
+
+def _messages(count):
+    """Build `count` message dicts in send_many's expected shape."""
+    return [
+        {"recipients": ["you@example.com"], "subject": "hi", "body": str(i)}
+        for i in range(count)
+    ]
+
+
+def _refuse_indices(fake, bad):
+    """Make the fake refuse the messages at the given zero-based indices.
+
+    Wraps the fake's send_message so delivery attempts are counted and the
+    chosen ones raise SMTPRecipientsRefused. Returns the list of attempted
+    indices for asserting how far the batch got.
+    """
+    inner = fake.send_message
+    attempts = []
+
+    def send_message(msg):
+        index = len(attempts)
+        attempts.append(index)
+        if index in bad:
+            raise smtplib.SMTPRecipientsRefused(
+                {"you@example.com": (550, b"mailbox unavailable")}
+            )
+        inner(msg)
+
+    fake.send_message = send_message
+    return attempts
+
+
+def test_send_many_all_delivered():
+    """A clean batch sends every message and raises nothing."""
+    with _sender() as sender:
+        attempts = _refuse_indices(current_fake(), bad=set())
+        sender.send_many(_messages(5))
+    assert attempts == list(range(5))
+    assert current_fake()._state["sent"]
+
+
+def test_send_many_collects_refusals():
+    """Refused messages don't kill the batch; they surface at the end.
+
+    Below the abort threshold every message is still attempted, and the
+    final BulkAbortError carries the (index, exception) pairs.
+    """
+    with _sender() as sender:
+        attempts = _refuse_indices(current_fake(), bad={1, 3})
+        with pytest.raises(BulkAbortError) as excinfo:
+            sender.send_many(_messages(5))
+    assert attempts == list(range(5))
+    assert [index for index, _ in excinfo.value.failures] == [1, 3]
+    assert all(
+        isinstance(exc, smtplib.SMTPRecipientsRefused)
+        for _, exc in excinfo.value.failures
+    )
+
+
+def test_send_many_aborts_at_failure_threshold():
+    """A broadly failing batch is abandoned once the threshold is hit.
+
+    With every third message refused, the failure ratio reaches one third
+    right after the minimum batch size, so send_many must stop iterating
+    well before the end instead of grinding through all 90 messages.
+    """
+    total = _BULK_ABORT_MIN_BATCH * 3
+    with _sender() as sender:
+        attempts = _refuse_indices(
+            current_fake(), bad={i for i in range(total) if i % 3 == 0}
+        )
+        with pytest.raises(BulkAbortError):
+            sender.send_many(_messages(total))
+    assert _BULK_ABORT_MIN_BATCH <= len(attempts) < total
+
+
+def test_send_many_reraises_auth_error():
+    """A failed authentication aborts immediately, not via BulkAbortError."""
+
+    def send_message(msg):
+        raise smtplib.SMTPAuthenticationError(535, b"authentication failed")
+
+    with _sender() as sender:
+        current_fake().send_message = send_message
+        with pytest.raises(smtplib.SMTPAuthenticationError):
+            sender.send_many(_messages(3))